@@ -1,4 +1,18 @@
-from .async_pal_rcon import AsyncPalRcon
+from typing import TYPE_CHECKING
+
 from .pal_rcon import PalRcon
 
+if TYPE_CHECKING:
+    from .async_pal_rcon import AsyncPalRcon
+
+__all__ = ["AsyncPalRcon", "PalRcon"]
+
 __version__ = "0.0.3"
+
+
+def __getattr__(name):
+    if name == "AsyncPalRcon":
+        from .async_pal_rcon import AsyncPalRcon
+
+        return AsyncPalRcon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,10 +9,20 @@ from .errors import (
     PalRconError,
 )
 from .models import CommandPacket, CommandResponse, PlayerlistResponse
-from .utils import check_max_attempts, generate_packet_id, get_initial, safe_message
+from .utils import (
+    check_max_attempts,
+    decode_message,
+    generate_packet_id,
+    get_initial,
+    parse_command,
+    safe_message,
+)
 
 logger = logging.getLogger(__name__)
 
+_LEN = struct.Struct("<I")
+_IDTYPE = struct.Struct("<iI")
+
 
 class AsyncRcon:
     def __init__(self, host: str, port: int, password: str) -> None:
@@ -22,90 +32,126 @@ class AsyncRcon:
 
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
-        self._lock = asyncio.Lock()
+        self._connected = False
+        self._conn_lock = asyncio.Lock()
+        self._io_lock = asyncio.Lock()
 
     async def connect(self) -> None:
-        async with self._lock:
-            self._reader, self._writer = await asyncio.open_connection(
-                self.host, self.port
-            )
-            await self._authenticate()
+        async with self._conn_lock:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            writer.transport.set_write_buffer_limits(high=0)
+            async with self._io_lock:
+                if self._writer is not None:
+                    self._writer.close()
+                self._reader, self._writer = reader, writer
+                self._connected = True
+                try:
+                    await self._authenticate()
+                except BaseException:
+                    self._connected = False
+                    raise
 
     async def _authenticate(self) -> None:
         packet_id = generate_packet_id()
         cmd = CommandPacket(packet_id, 3, self.password)
         await self._send_command(cmd)
         await self._receive_response(cmd)
-        logger.debug(f"Successful login: {self.host}:{self.port}")
+        logger.debug("Successful login: %s:%s", self.host, self.port)
 
     async def disconnect(self):
         if not self._writer or self._writer.is_closing():
             raise ConnectionError("Not connected to the server")
-        async with self._lock:
-            if self._writer or not self._writer.is_closing():
+        async with self._conn_lock, self._io_lock:
+            self._connected = False
+            if self._writer and not self._writer.is_closing():
                 self._writer.close()
                 await self._writer.wait_closed()
             self._writer = None
             self._reader = None
-            logger.debug(f"Disconnected from {self.host}:{self.port}")
+            logger.debug("Disconnected from %s:%s", self.host, self.port)
 
     async def execute_command(self, command: str | list) -> CommandResponse:
+        _, command = parse_command(command)
+        return await self._execute(command)
+
+    async def _execute(self, command: str) -> CommandResponse:
         packet_id = generate_packet_id()
-        command = command if isinstance(command, str) else " ".join(command)
-        if command.startswith("/"):
-            command = command[1:]
         cmd = CommandPacket(packet_id, 2, command)
-        async with self._lock:
-            await self._send_command(cmd)
-            return await self._receive_response(cmd)
+        async with self._io_lock:
+            try:
+                await self._send_command(cmd)
+                return await self._receive_response(cmd)
+            except (ConnectionError, asyncio.CancelledError):
+                self._connected = False
+                if self._writer is not None:
+                    self._writer.close()
+                raise
 
     async def _send_command(self, command: CommandPacket) -> None:
         logger.debug(
-            f"Sending message: packet_id={command.packet_id}, "
-            + f"packet_type={command.packet_type}, "
-            + f"message={command.message if command.message != self.password else '**Password**'}",
+            "Sending message: packet_id=%s, packet_type=%s, message=%s",
+            command.packet_id,
+            command.packet_type,
+            command.message if command.message != self.password else "**Password**",
         )
-        if not self._writer or self._writer.is_closing():
+        await self._send_many([command.pack_message()])
+
+    async def _send_many(self, packets: list[bytes]) -> None:
+        if not self._connected:
             raise ConnectionError("Not connected to the server")
-        packed_message = command.pack_message()
-        self._writer.write(packed_message)
+        self._writer.writelines(packets)
         await self._writer.drain()
 
     async def _receive_response(self, send_command: CommandPacket) -> CommandResponse:
-        if not self._reader or self._reader.at_eof():
+        if not self._connected:
             raise ConnectionError("Not connected to the server")
-        len_bytes = await self._reader.readexactly(4)
-        length = struct.unpack("<I", len_bytes)[0]
-        response = await self._reader.read(length)
-        packet_id, response_type = struct.unpack("<iI", response[:8])
-        message, null = response[8:-2], response[-2:]
-        logger.debug(f"Received message: {packet_id=}, {response_type=}, {message=}")
+        len_bytes = await self._read_exactly(4)
+        length = _LEN.unpack(len_bytes)[0]
+        response = await self._read_exactly(length)
+        if length < 10:
+            raise InvalidPacketError("Received message is not a valid RCON packet")
+        packet_id, response_type = _IDTYPE.unpack_from(response, 0)
+        mv = memoryview(response)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received message: packet_id=%s, response_type=%s, message=%r",
+                packet_id,
+                response_type,
+                bytes(mv[8:-2]),
+            )
 
         if packet_id != send_command.packet_id:
             logger.debug(
-                "Received packets have different IDs"
-                + f"(send: {send_command.packet_id}, recv: {packet_id})"
+                "Received packets have different IDs(send: %s, recv: %s)",
+                send_command.packet_id,
+                packet_id,
             )
 
         if packet_id == -1:
             raise AuthenticationFailedError("Failed to authenticate with the server")
 
-        if null != b"\x00\x00":
+        if mv[-2] != 0 or mv[-1] != 0:
             raise InvalidPacketError("Received message is not a valid RCON packet")
 
-        if message and not message.endswith(b"\n"):
+        if len(mv) > 10 and mv[-3] != 0x0A:
             raise IncompleteMessageError(
-                "Received message does not end with a newline", message
+                "Received message does not end with a newline", bytes(mv[8:-2])
             )
 
         return CommandResponse(
             packet_id,
             response_type,
-            message.decode()[:-1],
+            decode_message(mv[8:-3]),
             len_bytes + response,
             send_command,
         )
 
+    async def _read_exactly(self, length: int) -> bytes:
+        try:
+            return await self._reader.readexactly(length)
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionError("Connection closed by the server") from e
+
 
 class AsyncPalRcon(AsyncRcon):
     def __init__(self, host: str, port: int, password: str) -> None:
@@ -129,7 +175,7 @@ class AsyncPalRcon(AsyncRcon):
             except (ConnectionError, AuthenticationFailedError):
                 if attempt == max_attempts:
                     raise
-                logger.debug(f"Connect Retrying... {attempt + 1}/{max_attempts}")
+                logger.debug("Connect Retrying... %s/%s", attempt + 1, max_attempts)
                 await asyncio.sleep(attempt)
                 attempt += 1
         raise PalRconError(f"Failed to connect after {max_attempts} attempts")
@@ -138,38 +184,33 @@ class AsyncPalRcon(AsyncRcon):
         self, command: str | list, max_attempts: int | None = 1
     ) -> CommandResponse:
         max_attempts = check_max_attempts(max_attempts)
+        cmd, command = parse_command(command)
+        initial = get_initial(cmd)
         attempt = 1
         reconnect_attempted = False
         while attempt <= max_attempts:
             try:
-                res = await super().execute_command(command)
-                if isinstance(command, list):
-                    cmd = command[0].replace("/", "").lower()
-                else:
-                    cmd = command.split(" ")[0].replace("/", "").lower()
-                initial = get_initial(cmd)
-                if res.message.startswith(initial):
-                    res.is_successful = True
-                return res
+                return await self._execute_once(command, initial)
             except (ConnectionError, AuthenticationFailedError):
                 if reconnect_attempted:
                     raise
-                try:
-                    logger.debug("Reconnecting... 1/1")
-                    await self.connect(max_attempts=1)
-                    reconnect_attempted = True
-                    continue
-                except (ConnectionError, AuthenticationFailedError):
-                    raise
+                logger.debug("Reconnecting... 1/1")
+                await self.connect(max_attempts=1)
+                reconnect_attempted = True
             except (IncompleteMessageError, InvalidPacketError):
                 if attempt == max_attempts:
                     raise
-                logger.debug(f"Retrying... {attempt + 1}/{max_attempts}")
+                logger.debug("Retrying... %s/%s", attempt + 1, max_attempts)
                 await asyncio.sleep(1)
                 attempt += 1
-                continue
         raise PalRconError("Failed to execute command")
 
+    async def _execute_once(self, command: str, initial: str) -> CommandResponse:
+        res = await self._execute(command)
+        if res.message.startswith(initial):
+            res.is_successful = True
+        return res
+
     async def send_shutdown(
         self,
         seconds: int | None = 1,
@@ -1,21 +1,17 @@
 import argparse
-import asyncio
-import base64
-import json
 import logging
 import os
-from dataclasses import asdict
 
 from . import __version__
-from .async_pal_rcon import AsyncPalRcon
 from .models import CommandResponse, PlayerlistResponse
 from .pal_rcon import PalRcon
+from .utils import parse_command
 
 
 def rcon(
     host: str, port: int, password: str, command: str
 ) -> CommandResponse | PlayerlistResponse:
-    cmd = command.split(" ")[0].replace("/", "").lower()
+    cmd, _ = parse_command(command)
     with PalRcon(host, port, password) as rcon:
         if cmd == "showplayers":
             res = rcon.send_show_players()
@@ -27,7 +23,9 @@ def rcon(
 async def arcon(
     host: str, port: int, password: str, command: str
 ) -> CommandResponse | PlayerlistResponse:
-    cmd = command.split(" ")[0].replace("/", "").lower()
+    from .async_pal_rcon import AsyncPalRcon
+
+    cmd, _ = parse_command(command)
     async with AsyncPalRcon(host, port, password) as rcon:
         if cmd == "showplayers":
             res = await rcon.send_show_players()
@@ -38,6 +36,8 @@ async def arcon(
 
 def custom_json_encoder(obj):
     if isinstance(obj, bytes):
+        import base64
+
         return base64.b64encode(obj).decode("utf-8")
     return obj
 
@@ -69,13 +69,16 @@ def main():
         logging.basicConfig(level=logging.INFO)
 
     if args.a:
+        import asyncio
+
         res = asyncio.run(arcon(args.host, args.port, password, args.command))
     else:
         res = rcon(args.host, args.port, password, args.command)
 
     if args.json:
-        res = asdict(res)
-        print(json.dumps(res, default=custom_json_encoder))
+        import json
+
+        print(json.dumps(res.to_dict(), default=custom_json_encoder))
         return
-    print(asdict(res))
+    print(res.to_dict())
     print("\n" + res.message)
@@ -3,6 +3,18 @@ from dataclasses import dataclass, field
 
 CHARACTER_CODE = "ascii"
 
+_HDR = struct.Struct("<III")
+
+
+def _encode_body(message: str) -> tuple[int, bytes]:
+    cmd_bytes = message.encode(CHARACTER_CODE)
+    return len(cmd_bytes) + 10, cmd_bytes + b"\x00\x00"
+
+
+_FIXED_BODIES = {
+    cmd: _encode_body(cmd) for cmd in ("info", "save", "showplayers", "doexit")
+}
+
 
 @dataclass(slots=True)
 class CommandPacket:
@@ -12,12 +24,16 @@ class CommandPacket:
     raw_message: bytes | None = field(default=None)
 
     def pack_message(self) -> bytes:
-        cmd_bytes = self.message.encode(CHARACTER_CODE)
-        return (
-            struct.pack("<III", len(cmd_bytes) + 10, self.packet_id, self.packet_type)
-            + cmd_bytes
-            + b"\x00\x00"
-        )
+        length, body = _FIXED_BODIES.get(self.message) or _encode_body(self.message)
+        return _HDR.pack(length, self.packet_id, self.packet_type) + body
+
+    def to_dict(self) -> dict:
+        return {
+            "packet_id": self.packet_id,
+            "packet_type": self.packet_type,
+            "message": self.message,
+            "raw_message": self.raw_message,
+        }
 
 
 @dataclass(slots=True)
@@ -28,6 +44,15 @@ class CommandResponse(CommandPacket):
     def __bool__(self):
         return self.is_successful
 
+    def to_dict(self) -> dict:
+        d = CommandPacket.to_dict(self)
+        send_command = self.send_command
+        d["send_command"] = (
+            send_command.to_dict() if send_command is not None else None
+        )
+        d["is_successful"] = self.is_successful
+        return d
+
 
 @dataclass(slots=True)
 class Player:
@@ -35,6 +60,13 @@ class Player:
     player_uid: str
     steam_id: str
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "player_uid": self.player_uid,
+            "steam_id": self.steam_id,
+        }
+
 
 @dataclass(slots=True)
 class PlayerlistResponse(CommandResponse):
@@ -44,15 +76,25 @@ class PlayerlistResponse(CommandResponse):
     def __iter__(self):
         return iter(self.players)
 
+    def to_dict(self) -> dict:
+        d = CommandResponse.to_dict(self)
+        d["players"] = [p.to_dict() for p in self.players]
+        d["invalid_uid_players"] = [p.to_dict() for p in self.invalid_uid_players]
+        return d
+
     @classmethod
     def from_response(cls, packet: CommandResponse) -> "PlayerlistResponse":
         players = []
         invalid_uid_players = []
         is_successful = True
-        for line in packet.message.splitlines():
-            if line == "name,playeruid,steamid":
+        for line in packet.message.split("\n"):
+            if not line or line == "name,playeruid,steamid":
                 continue
-            name, player_uid, steam_id = line.split(",")
+            c2 = line.rfind(",")
+            c1 = line.rfind(",", 0, c2) if c2 > 0 else -1
+            if c1 < 0:
+                raise ValueError(f"Invalid player line: {line!r}")
+            name, player_uid, steam_id = line[:c1], line[c1 + 1 : c2], line[c2 + 1 :]
             if player_uid == "00000000":
                 invalid_uid_players.append(Player(name, player_uid, steam_id))
                 is_successful = False
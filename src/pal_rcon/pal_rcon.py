@@ -10,10 +10,21 @@ from .errors import (
     PalRconError,
 )
 from .models import CommandPacket, CommandResponse, PlayerlistResponse
-from .utils import check_max_attempts, generate_packet_id, get_initial, safe_message
+from .utils import (
+    check_max_attempts,
+    decode_message,
+    generate_packet_id,
+    get_initial,
+    parse_command,
+    safe_message,
+)
 
 logger = logging.getLogger(__name__)
 
+_LEN = struct.Struct("<I")
+_IDTYPE = struct.Struct("<iI")
+_SOCKET_OPTIONS = ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)
+
 
 class Rcon:
     def __init__(self, host: str, port: int, password: str) -> None:
@@ -22,9 +33,13 @@ class Rcon:
         self.password = password
 
         self._sock = None
+        self._len_buf = bytearray(4)
+        self._recv_buf = bytearray(4096)
 
     def connect(self) -> None:
         self._sock = socket.create_connection((self.host, self.port))
+        for opt in _SOCKET_OPTIONS:
+            self._sock.setsockopt(*opt)
         self._authenticate()
 
     def _authenticate(self) -> None:
@@ -32,28 +47,30 @@ class Rcon:
         cmd = CommandPacket(packet_id, 3, self.password)
         self._send_command(cmd)
         self._receive_response(cmd)
-        logger.debug(f"Successful login: {self.host}:{self.port}")
+        logger.debug("Successful login: %s:%s", self.host, self.port)
 
     def disconnect(self):
         if self._sock:
             self._sock.close()
         self._sock = None
-        logger.debug(f"Disconnected from {self.host}:{self.port}")
+        logger.debug("Disconnected from %s:%s", self.host, self.port)
 
     def execute_command(self, command: str | list) -> CommandResponse:
+        _, command = parse_command(command)
+        return self._execute(command)
+
+    def _execute(self, command: str) -> CommandResponse:
         packet_id = generate_packet_id()
-        command = command if isinstance(command, str) else " ".join(command)
-        if command.startswith("/"):
-            command = command[1:]
         cmd = CommandPacket(packet_id, 2, command)
         self._send_command(cmd)
         return self._receive_response(cmd)
 
     def _send_command(self, command: CommandPacket) -> None:
         logger.debug(
-            f"Sending message: packet_id={command.packet_id}, "
-            + f"packet_type={command.packet_type}, "
-            + f"message={command.message if command.message != self.password else '**Password**'}",
+            "Sending message: packet_id=%s, packet_type=%s, message=%s",
+            command.packet_id,
+            command.packet_type,
+            command.message if command.message != self.password else "**Password**",
         )
         if self._sock is None:
             raise ConnectionError("Not connected to the server")
@@ -63,38 +80,58 @@ class Rcon:
     def _receive_response(self, send_command: CommandPacket) -> CommandResponse:
         if self._sock is None:
             raise ConnectionError("Not connected to the server")
-        len_bytes = self._sock.recv(4)
-        length = struct.unpack("<I", len_bytes)[0]
-        response = self._sock.recv(length)
-        packet_id, response_type = struct.unpack("<iI", response[:8])
-        message, null = response[8:-2], response[-2:]
-        logger.debug(f"Received message: {packet_id=}, {response_type=}, {message=}")
+        self._recv_exactly(memoryview(self._len_buf))
+        length = _LEN.unpack_from(self._len_buf)[0]
+        if length > len(self._recv_buf):
+            self._recv_buf = bytearray(length)
+        mv = memoryview(self._recv_buf)[:length]
+        self._recv_exactly(mv)
+        if length < 10:
+            raise InvalidPacketError("Received message is not a valid RCON packet")
+        packet_id, response_type = _IDTYPE.unpack_from(mv, 0)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received message: packet_id=%s, response_type=%s, message=%r",
+                packet_id,
+                response_type,
+                bytes(mv[8:-2]),
+            )
 
         if packet_id != send_command.packet_id:
             logger.debug(
-                "Received packets have different IDs"
-                + f"(send: {send_command.packet_id}, recv: {packet_id})"
+                "Received packets have different IDs(send: %s, recv: %s)",
+                send_command.packet_id,
+                packet_id,
             )
 
         if packet_id == -1:
             raise AuthenticationFailedError("Failed to authenticate with the server")
 
-        if null != b"\x00\x00":
+        if mv[-2] != 0 or mv[-1] != 0:
             raise InvalidPacketError("Received message is not a valid RCON packet")
 
-        if message and not message.endswith(b"\n"):
+        if len(mv) > 10 and mv[-3] != 0x0A:
             raise IncompleteMessageError(
-                "Received message does not end with a newline", message
+                "Received message does not end with a newline", bytes(mv[8:-2])
             )
 
         return CommandResponse(
             packet_id,
             response_type,
-            message.decode()[:-1],
-            len_bytes + response,
+            decode_message(mv[8:-3]),
+            b"".join((self._len_buf, mv)),
             send_command,
         )
 
+    def _recv_exactly(self, buf: memoryview) -> None:
+        length = len(buf)
+        off = 0
+        while off < length:
+            n = self._sock.recv_into(buf[off:])
+            if n == 0:
+                raise ConnectionError("Connection closed by the server")
+            off += n
+
 
 class PalRcon(Rcon):
     def __init__(self, host: str, port: int, password: str) -> None:
@@ -118,7 +155,7 @@ class PalRcon(Rcon):
             except (ConnectionError, AuthenticationFailedError):
                 if attempt == max_attempts:
                     raise
-                logger.debug(f"Connect Retrying... {attempt + 1}/{max_attempts}")
+                logger.debug("Connect Retrying... %s/%s", attempt + 1, max_attempts)
                 time.sleep(attempt)
                 attempt += 1
         raise PalRconError(f"Failed to connect after {max_attempts} attempts")
@@ -127,37 +164,33 @@ class PalRcon(Rcon):
         self, command: str | list, max_attempts: int | None = 1
     ) -> CommandResponse:
         max_attempts = check_max_attempts(max_attempts)
+        cmd, command = parse_command(command)
+        initial = get_initial(cmd)
         attempt = 1
-        reconnetct_attempt = False
+        reconnect_attempted = False
         while attempt <= max_attempts:
             try:
-                res = super().execute_command(command)
-                if isinstance(command, list):
-                    cmd = command[0].replace("/", "").lower()
-                else:
-                    cmd = command.split(" ")[0].replace("/", "").lower()
-                initial = get_initial(cmd)
-                if res.message.startswith(initial):
-                    res.is_successful = True
-                return res
+                return self._execute_once(command, initial)
             except (ConnectionError, AuthenticationFailedError):
-                if reconnetct_attempt:
-                    raise
-                try:
-                    logger.debug("Reconnecting... 1/1")
-                    self.connect(max_attempts=1)
-                    reconnetct_attempt = True
-                    continue
-                except (ConnectionError, AuthenticationFailedError):
+                if reconnect_attempted:
                     raise
+                logger.debug("Reconnecting... 1/1")
+                self.connect(max_attempts=1)
+                reconnect_attempted = True
             except (IncompleteMessageError, InvalidPacketError):
                 if attempt == max_attempts:
                     raise
-                logger.debug(f"Retrying... {attempt + 1}/{max_attempts}")
+                logger.debug("Retrying... %s/%s", attempt + 1, max_attempts)
                 time.sleep(1)
                 attempt += 1
         raise PalRconError("Failed to execute command")
 
+    def _execute_once(self, command: str, initial: str) -> CommandResponse:
+        res = self._execute(command)
+        if res.message.startswith(initial):
+            res.is_successful = True
+        return res
+
     def send_shutdown(
         self,
         seconds: int | None = 1,
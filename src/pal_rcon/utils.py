@@ -1,38 +1,50 @@
 import random
 
+from .models import CHARACTER_CODE
+
+_RNG = random.Random()
+
+_INITIAL = {
+    "shutdown": "The",
+    "doexit": "Shutdown",
+    "broadcast": "Broadcasted:",
+    "kickplayer": "Kicked:",
+    "banplayer": "Baned:",
+    "showplayers": "name",
+    "info": "Welcome",
+    "save": "Complete",
+}
+
 
 def generate_packet_id() -> int:
-    return random.randint(1, 2**31 - 1)
+    return _RNG.getrandbits(31) or 1
 
 
 def safe_message(message: str) -> str:
     return message.replace(" ", "_")
 
 
+def decode_message(data: memoryview) -> str:
+    try:
+        return str(data, CHARACTER_CODE)
+    except UnicodeDecodeError:
+        return str(data, "utf-8")
+
+
 def check_max_attempts(max_attempts: int | None) -> int:
     if max_attempts is None or max_attempts < 1:
         return 1
     return max_attempts
 
 
+def parse_command(command: str | list) -> tuple[str, str]:
+    if not isinstance(command, str):
+        command = " ".join(command)
+    cmd = command.partition(" ")[0].replace("/", "").lower()
+    if command.startswith("/"):
+        command = command[1:]
+    return cmd, command
+
+
 def get_initial(command: str) -> str:
-    command = command.lower()
-    match command:
-        case "shutdown":
-            return "The"
-        case "doexit":
-            return "Shutdown"
-        case "broadcast":
-            return "Broadcasted:"
-        case "kickplayer":
-            return "Kicked:"
-        case "banplayer":
-            return "Baned:"
-        case "showplayers":
-            return "name"
-        case "info":
-            return "Welcome"
-        case "save":
-            return "Complete"
-        case _:
-            return ""
+    return _INITIAL.get(command.lower(), "")